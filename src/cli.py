@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# src/cli.py
+import argparse
+import os
+import sys
+from rich.console import Console
+from src.command_server import DEFAULT_SOCKET, load_socket_path, send_command
+
+console = Console()
+
+DEFAULT_TIMEOUT = 60
+
+# Commands that record from the microphone; they queue behind each other
+# for 10+ seconds apiece, so wait for the reply without a deadline
+BLOCKING_COMMANDS = ["dictation", "voice"]
+
+
+def main(argv=None):
+    """Send a single command to a running assistant, e.g. dea-cli "add task buy milk" """
+    parser = argparse.ArgumentParser(prog="dea-cli", description="Drive a running assistant")
+    parser.add_argument("command", nargs="+", help="command to run, e.g. 'add task buy milk'")
+    parser.add_argument("--socket", help="command socket path")
+    parser.add_argument("--timeout", type=float,
+                        help=f"seconds to wait for a reply (default {DEFAULT_TIMEOUT}, "
+                             "none for dictation; 0 waits forever)")
+    args = parser.parse_args(argv)
+
+    path = args.socket or os.environ.get("DEA_SOCKET") or load_socket_path() or DEFAULT_SOCKET
+    command = " ".join(args.command)
+
+    if args.timeout is not None:
+        timeout = args.timeout or None
+    elif command.lower() in BLOCKING_COMMANDS:
+        timeout = None
+    else:
+        timeout = DEFAULT_TIMEOUT
+
+    try:
+        reply = send_command(command, path=path, timeout=timeout)
+    except TimeoutError:
+        # TimeoutError is an OSError, but here the assistant has the command
+        console.print(f"[yellow]⚠️ Sent '{command}' but no reply arrived within {timeout:g}s; "
+                      "the assistant may still be running it[/yellow]")
+        return 3
+    except (OSError, ValueError) as e:
+        console.print(f"[red]❌ Could not reach assistant at {path}: {e}[/red]")
+        return 2
+
+    output = reply.get("output")
+    if output:
+        print(output, end="" if output.endswith("\n") else "\n")
+
+    if reply.get("ok"):
+        if not output:
+            console.print(f"[green]✅ {command}[/green]")
+        return 0
+
+    error = reply.get("error") or reply.get("status")
+    console.print(f"[yellow]⚠️ {command}: {error}[/yellow]")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
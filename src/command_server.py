@@ -0,0 +1,157 @@
+# src/command_server.py
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import yaml
+from rich.console import Console
+
+console = Console()
+
+DEFAULT_SOCKET = "/tmp/dea.sock"
+
+
+def load_socket_path(config_path="config/config.yaml"):
+    """Read the command socket path from config (empty means disabled)"""
+    try:
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f) or {}
+    except Exception:
+        config = {}
+    return config.get("command_socket") or None
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """Handle one client connection: one JSON request per line, one JSON reply per line"""
+
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+            reply = self.server.dispatch_line(line)
+            try:
+                self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, handler):
+        self.command_handler = handler
+        super().__init__(path, _CommandHandler)
+
+    def dispatch_line(self, line):
+        """Decode a request line and run it against the command handler"""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"ok": False, "error": f"invalid JSON: {e}"}
+
+        command = request.get("command") if isinstance(request, dict) else None
+        if not isinstance(command, str) or not command.strip():
+            return {"ok": False, "error": "missing 'command'"}
+
+        try:
+            status, output = self.command_handler(command.strip())
+        except Exception as e:
+            return {"ok": False, "command": command, "error": str(e)}
+        return {"ok": status == "ok", "command": command, "status": status, "output": output}
+
+
+class CommandServer:
+    """Line-delimited JSON command socket for driving a running assistant.
+
+    Each request is ``{"command": "show tasks"}`` and each reply is
+    ``{"ok": true, "command": ..., "status": "ok", "output": "..."}``. The
+    handler returns ``(status, output)``. Every client connection is served
+    on its own thread against the already-loaded models.
+    """
+
+    def __init__(self, handler, path=DEFAULT_SOCKET):
+        self.handler = handler
+        self.path = path
+        self.server = None
+        self.thread = None
+        self._bound = None
+
+    def _clear_stale_socket(self):
+        """Remove a dead socket left by a previous run; refuse anything else"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+
+        if not stat.S_ISSOCK(st.st_mode):
+            console.print(f"[red]❌ Command socket path exists and is not a socket: {self.path}[/red]")
+            return False
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(1)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                # Nobody listening: stale socket from a previous run
+                os.remove(self.path)
+                return True
+
+        console.print(f"[red]❌ Another assistant is already listening on {self.path}[/red]")
+        return False
+
+    def start(self):
+        """Bind the socket and serve in a background thread"""
+        if not self._clear_stale_socket():
+            return False
+
+        # Owner-only from the moment the socket appears on disk
+        old_umask = os.umask(0o177)
+        try:
+            self.server = _ThreadingServer(self.path, self.handler)
+            st = os.stat(self.path)
+            self._bound = (st.st_dev, st.st_ino)
+        except OSError as e:
+            console.print(f"[red]❌ Command socket unavailable: {e}[/red]")
+            self.server = None
+            return False
+        finally:
+            os.umask(old_umask)
+
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        console.print(f"[green]✅ Listening for commands on {self.path}[/green]")
+        return True
+
+    def stop(self):
+        """Shut down the server and remove the socket file"""
+        if not self.server:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+
+        # Only remove the path if it is still the socket this server bound
+        try:
+            st = os.stat(self.path)
+            if (st.st_dev, st.st_ino) == self._bound:
+                os.remove(self.path)
+        except OSError:
+            pass
+        self._bound = None
+
+
+def send_command(command, path=DEFAULT_SOCKET, timeout=60):
+    """Send one command to a running assistant and return the decoded reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall((json.dumps({"command": command}) + "\n").encode("utf-8"))
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("assistant closed the connection without replying")
+    return json.loads(line)
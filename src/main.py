@@ -2,22 +2,186 @@
 # src/main.py
 import sys
 import os
+import argparse
+import io
+import signal
 from rich.console import Console
 from src.text_input import get_text_input
 from src.voice_input import VoiceInput
 from src.tts import TextToSpeech
 from src.task_manager import add_task, show_tasks
 from src.app_launcher import launch_app
-from src.ui import print_header, print_weather, print_system_status, print_menu
+from src.command_server import CommandServer, load_socket_path
+from src.tracing import setup_tracing, span
+from src.ui import print_header, print_weather, print_system_status, print_menu, print_stats
 
 console = Console()
 
+# Commands that take free text; traced under the prefix so stats stay grouped
+TEXT_COMMANDS = ["add task", "say"]
+
+def command_label(cmd_lower):
+    """Stage name for a command, without any free text it carries"""
+    for prefix in TEXT_COMMANDS:
+        if cmd_lower.startswith(prefix + " "):
+            return prefix
+    return cmd_lower
+
+def handle_command(command, voice, tts, interactive=True, out=None):
+    """Run a single command against the loaded models.
+
+    Returns "ok", "exit", "unknown", or "unsupported" (interactive-only
+    commands requested over the command socket). Command output goes to
+    ``out`` when given, otherwise to the assistant's console.
+    """
+    out = out or console
+    cmd_lower = command.lower().strip()
+
+    # Each command is one traced interaction; unknown input is not recorded
+    # under its own text
+    with span(f"command.{command_label(cmd_lower)}") as record:
+        status = _dispatch(command, cmd_lower, voice, tts, interactive, out)
+        if status == "unknown":
+            record["stage"] = "command.unknown"
+        record["status"] = status
+    return status
+
+def _dispatch(command, cmd_lower, voice, tts, interactive, out):
+    """Command table shared by the prompt and the command socket"""
+    # Socket callers get their reply as soon as the work is done; speech
+    # is queued instead of holding the reply until playback finishes
+    speak = tts.speak if interactive else tts.speak_async
+
+    # Handle commands
+    if cmd_lower == "exit" or cmd_lower == "quit":
+        if not interactive:
+            return "unsupported"
+        out.print("[green]👋 Goodbye![/green]")
+        speak("Goodbye")
+        return "exit"
+
+    elif cmd_lower == "dictation" or cmd_lower == "voice":
+        text = voice.get_voice_input()
+        if text:
+            add_task(text, out)
+            speak(f"Task added: {text}")
+
+    elif cmd_lower == "show tasks":
+        show_tasks(out)
+
+    elif cmd_lower.startswith("add task "):
+        task_text = command[9:].strip()
+        if task_text:
+            add_task(task_text, out)
+            speak("Task added")
+        else:
+            out.print("[yellow]⚠️ Please provide task text[/yellow]")
+
+    elif cmd_lower == "weather":
+        print_weather(out)
+
+    elif cmd_lower == "status":
+        print_system_status(out)
+
+    elif cmd_lower == "help":
+        print_menu(out)
+
+    elif cmd_lower == "stats":
+        print_stats(out)
+
+    elif cmd_lower.startswith("say "):
+        # Test TTS
+        text_to_speak = command[4:].strip()
+        if text_to_speak:
+            speak(text_to_speak)
+        else:
+            out.print("[yellow]⚠️ Provide text to speak (e.g., 'say hello')[/yellow]")
+
+    elif cmd_lower == "test piper":
+        # Force test Piper
+        out.print("[cyan]Testing Piper TTS specifically...[/cyan]")
+        speak("This is a test of the Piper text to speech engine", force_engine='piper')
+
+    elif cmd_lower == "test espeak":
+        # Force test espeak
+        out.print("[cyan]Testing espeak TTS specifically...[/cyan]")
+        speak("This is a test of the espeak text to speech engine", force_engine='espeak')
+
+    elif cmd_lower == "download voice":
+        if not interactive:
+            return "unsupported"
+        # Download Piper model
+        tts.list_available_models()
+        out.print("[cyan]Enter model name (or 'list' to see options again):[/cyan]")
+        model = input("Model: ").strip()
+        if model and model.lower() != 'list':
+            tts.download_model(model)
+        elif model.lower() == 'list':
+            tts.list_available_models()
+
+    elif cmd_lower in ["volume up", "volume down", "mute", "unmute",
+                      "brightness up", "brightness down", "notes", 
+                      "calendar", "search"]:
+        launch_app(command)
+
+    else:
+        out.print(f"[yellow]⚠️ Unknown command: {command}[/yellow]")
+        out.print("[dim]Type 'help' to see available commands[/dim]")
+        return "unknown"
+
+    return "ok"
+
+def run_remote_command(command, voice, tts):
+    """Run a command for a socket client and return (status, rendered output)"""
+    out = Console(record=True, file=io.StringIO(), width=100)
+    status = handle_command(command, voice, tts, interactive=False, out=out)
+    return status, out.export_text()
+
+def _handle_sigterm(signum, frame):
+    """Unwind through main()'s cleanup so the command socket is removed"""
+    raise SystemExit(0)
+
+def wait_for_shutdown():
+    """Serve socket clients only, until SIGTERM or Ctrl+C"""
+    console.print("[dim]Running without a prompt; stop with SIGTERM or Ctrl+C[/dim]")
+    try:
+        while True:
+            signal.pause()
+    except KeyboardInterrupt:
+        pass
+
 def main():
     """Main application loop"""
+    parser = argparse.ArgumentParser(description="Debian Embedded Assistant")
+    parser.add_argument("--socket", help="listen for commands on this Unix socket (see dea-cli)")
+    parser.add_argument("--no-prompt", action="store_true",
+                        help="don't read commands from stdin; serve the socket only (for services)")
+    args = parser.parse_args()
+
+    socket_path = args.socket or load_socket_path()
+    if args.no_prompt and not socket_path:
+        parser.error("--no-prompt needs a command socket (--socket or command_socket in config)")
+
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
+    setup_tracing()
+
     # Initialize voice input and TTS
     voice = VoiceInput(model_size="tiny")
     tts = TextToSpeech()
 
+    # Optional command socket for other processes (dea-cli)
+    server = None
+    if socket_path:
+        server = CommandServer(
+            lambda cmd: run_remote_command(cmd, voice, tts),
+            path=socket_path
+        )
+        if not server.start():
+            server = None
+            if args.no_prompt:
+                sys.exit(1)
+
     # Print startup info
     print_header()
     print_weather()
@@ -27,88 +191,34 @@ def main():
     console.print("\n[bold green]🚀 Assistant ready! Type 'help' for commands.[/bold green]\n")
     tts.speak("Assistant ready")
 
-    while True:
-        try:
-            command = get_text_input()
-
-            if not command:
-                continue
-
-            cmd_lower = command.lower().strip()
-
-            # Handle commands
-            if cmd_lower == "exit" or cmd_lower == "quit":
-                console.print("[green]👋 Goodbye![/green]")
-                tts.speak("Goodbye")
-                break
-
-            elif cmd_lower == "dictation" or cmd_lower == "voice":
-                text = voice.get_voice_input()
-                if text:
-                    add_task(text)
-                    tts.speak(f"Task added: {text}")
-
-            elif cmd_lower == "show tasks":
-                show_tasks()
-
-            elif cmd_lower.startswith("add task "):
-                task_text = command[9:].strip()
-                if task_text:
-                    add_task(task_text)
-                    tts.speak("Task added")
-                else:
-                    console.print("[yellow]⚠️ Please provide task text[/yellow]")
-
-            elif cmd_lower == "weather":
-                print_weather()
-
-            elif cmd_lower == "status":
-                print_system_status()
-
-            elif cmd_lower == "help":
-                print_menu()
-
-            elif cmd_lower.startswith("say "):
-                # Test TTS
-                text_to_speak = command[4:].strip()
-                if text_to_speak:
-                    tts.speak(text_to_speak)
-                else:
-                    console.print("[yellow]⚠️ Provide text to speak (e.g., 'say hello')[/yellow]")
-
-            elif cmd_lower == "test piper":
-                # Force test Piper
-                console.print("[cyan]Testing Piper TTS specifically...[/cyan]")
-                tts.speak("This is a test of the Piper text to speech engine", force_engine='piper')
-
-            elif cmd_lower == "test espeak":
-                # Force test espeak
-                console.print("[cyan]Testing espeak TTS specifically...[/cyan]")
-                tts.speak("This is a test of the espeak text to speech engine", force_engine='espeak')
-
-            elif cmd_lower == "download voice":
-                # Download Piper model
-                tts.list_available_models()
-                console.print("[cyan]Enter model name (or 'list' to see options again):[/cyan]")
-                model = input("Model: ").strip()
-                if model and model.lower() != 'list':
-                    tts.download_model(model)
-                elif model.lower() == 'list':
-                    tts.list_available_models()
-
-            elif cmd_lower in ["volume up", "volume down", "mute", "unmute",
-                              "brightness up", "brightness down", "notes", 
-                              "calendar", "search"]:
-                launch_app(command)
-
-            else:
-                console.print(f"[yellow]⚠️ Unknown command: {command}[/yellow]")
-                console.print("[dim]Type 'help' to see available commands[/dim]")
-
-        except KeyboardInterrupt:
-            console.print("\n[yellow]⚠️ Interrupted. Type 'exit' to quit.[/yellow]")
-        except Exception as e:
-            console.print(f"[red]❌ Error: {e}[/red]")
+    try:
+        if args.no_prompt:
+            wait_for_shutdown()
+            return
+
+        while True:
+            try:
+                command = get_text_input()
+
+                if command is None:
+                    # stdin closed (backgrounded or under a service manager)
+                    if server:
+                        wait_for_shutdown()
+                    break
+
+                if not command:
+                    continue
+
+                if handle_command(command, voice, tts) == "exit":
+                    break
+
+            except KeyboardInterrupt:
+                console.print("\n[yellow]⚠️ Interrupted. Type 'exit' to quit.[/yellow]")
+            except Exception as e:
+                console.print(f"[red]❌ Error: {e}[/red]")
+    finally:
+        if server:
+            server.stop()
 
 if __name__ == "__main__":
     main()
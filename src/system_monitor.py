@@ -2,13 +2,16 @@
 import psutil
 import subprocess
 from rich.console import Console
+from src.tracing import traced
 
 console = Console()
 
+@traced("system.cpu")
 def get_cpu_usage():
     """Get CPU usage percentage"""
     return psutil.cpu_percent(interval=1)
 
+@traced("system.memory")
 def get_memory_usage():
     """Get memory usage"""
     mem = psutil.virtual_memory()
@@ -18,6 +21,7 @@ def get_memory_usage():
         "total_gb": mem.total / (1024**3)
     }
 
+@traced("system.battery")
 def get_battery():
     """Get battery status"""
     try:
@@ -32,6 +36,7 @@ def get_battery():
         pass
     return None
 
+@traced("system.disk")
 def get_disk_usage():
     """Get disk usage"""
     disk = psutil.disk_usage("/")
@@ -41,6 +46,7 @@ def get_disk_usage():
         "total_gb": disk.total / (1024**3)
     }
 
+@traced("system.brightness")
 def get_brightness():
     """Get screen brightness (if available)"""
     try:
@@ -67,6 +73,7 @@ def get_brightness():
         pass
     return "N/A"
 
+@traced("system.status")
 def get_system_status():
     """Get comprehensive system status"""
     mem = get_memory_usage()
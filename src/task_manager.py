@@ -1,70 +1,104 @@
 # src/task_manager.py
 import json
 import os
+import shutil
+import tempfile
+import threading
 from datetime import datetime
 from rich.console import Console
+from src.tracing import traced
 
 console = Console()
 DATA_FILE = "data/tasks.json"
 
+# Serializes load/modify/save when commands arrive from several threads
+_tasks_lock = threading.RLock()
+
 def ensure_data_dir():
     """Ensure data directory exists"""
     os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
 
+@traced("tasks.load")
 def load_tasks():
     """Load tasks from JSON file"""
     ensure_data_dir()
-    if not os.path.exists(DATA_FILE):
-        return []
-    try:
-        with open(DATA_FILE, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        console.print(f"[red]❌ Error loading tasks: {e}[/red]")
-        return []
+    with _tasks_lock:
+        if not os.path.exists(DATA_FILE):
+            return []
+        try:
+            with open(DATA_FILE, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            console.print(f"[red]❌ Error loading tasks: {e}[/red]")
+            return []
 
+@traced("tasks.save")
 def save_tasks(tasks):
     """Save tasks to JSON file"""
     ensure_data_dir()
+    # Write a temp file next to DATA_FILE and swap it in, so readers and a
+    # shutdown mid-save never see a truncated file
+    tmp_path = None
     try:
-        with open(DATA_FILE, "w") as f:
-            json.dump(tasks, f, indent=2)
+        with _tasks_lock:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(DATA_FILE), prefix=".tasks-", suffix=".json"
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(tasks, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(DATA_FILE):
+                # mkstemp creates 0600; keep the existing file's permissions
+                shutil.copymode(DATA_FILE, tmp_path)
+            os.replace(tmp_path, DATA_FILE)
+            tmp_path = None
     except Exception as e:
         console.print(f"[red]❌ Error saving tasks: {e}[/red]")
+    finally:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
-def add_task(task_text):
+def add_task(task_text, out=None):
     """Add a new task"""
-    tasks = load_tasks()
-    task = {
-        "id": len(tasks) + 1,
-        "text": task_text,
-        "created_at": datetime.now().isoformat(),
-        "completed": False
-    }
-    tasks.append(task)
-    save_tasks(tasks)
-    console.print(f"[green]✅ Task added: {task_text}[/green]")
+    out = out or console
+    with _tasks_lock:
+        tasks = load_tasks()
+        task = {
+            "id": len(tasks) + 1,
+            "text": task_text,
+            "created_at": datetime.now().isoformat(),
+            "completed": False
+        }
+        tasks.append(task)
+        save_tasks(tasks)
+    out.print(f"[green]✅ Task added: {task_text}[/green]")
 
 def complete_task(task_id):
     """Mark task as completed"""
-    tasks = load_tasks()
-    for task in tasks:
-        if task["id"] == task_id:
-            task["completed"] = True
-            save_tasks(tasks)
-            console.print(f"[green]✅ Task {task_id} completed[/green]")
-            return
+    with _tasks_lock:
+        tasks = load_tasks()
+        for task in tasks:
+            if task["id"] == task_id:
+                task["completed"] = True
+                save_tasks(tasks)
+                console.print(f"[green]✅ Task {task_id} completed[/green]")
+                return
     console.print(f"[yellow]⚠️ Task {task_id} not found[/yellow]")
 
-def show_tasks():
+def show_tasks(out=None):
     """Display all tasks"""
+    out = out or console
     tasks = load_tasks()
     if not tasks:
-        console.print("[yellow]📋 No tasks found.[/yellow]")
+        out.print("[yellow]📋 No tasks found.[/yellow]")
         return
 
-    console.print("\n[bold cyan]📋 Tasks:[/bold cyan]")
+    out.print("\n[bold cyan]📋 Tasks:[/bold cyan]")
     for t in tasks:
         status = "✅" if t["completed"] else "❌"
         created = datetime.fromisoformat(t["created_at"]).strftime("%Y-%m-%d %H:%M")
-        console.print(f"  {status} [{t['id']}] {t['text']} [dim]({created})[/dim]")
+        out.print(f"  {status} [{t['id']}] {t['text']} [dim]({created})[/dim]")
@@ -4,9 +4,11 @@ from rich.console import Console
 console = Console()
 
 def get_text_input(prompt="👉 Enter command: "):
-    """Get text input from user"""
+    """Get text input from user (None once stdin is closed)"""
     try:
         text = input(prompt)
         return text.strip()
-    except (EOFError, KeyboardInterrupt):
+    except EOFError:
+        return None
+    except KeyboardInterrupt:
         return ""
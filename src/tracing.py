@@ -0,0 +1,184 @@
+# src/tracing.py
+import contextvars
+import functools
+import json
+import logging
+import logging.handlers
+import math
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+import yaml
+from rich.console import Console
+
+console = Console()
+
+TRACE_FILE = "data/trace.jsonl"
+TRACE_MAX_BYTES = 1024 * 1024
+TRACE_BACKUPS = 3
+
+_enabled = True
+_trace_file = TRACE_FILE
+_trace_backups = TRACE_BACKUPS
+_logger = None
+_setup_lock = threading.Lock()
+
+# Id of the interaction the current thread is inside, and its innermost stage
+_current_trace = contextvars.ContextVar("dea_trace", default=None)
+_current_stage = contextvars.ContextVar("dea_stage", default=None)
+
+
+def setup_tracing(config_path="config/config.yaml"):
+    """Configure the trace file from config (trace_enabled, trace_file, ...)"""
+    global _enabled, _trace_file, _trace_backups, _logger
+    try:
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f) or {}
+    except Exception:
+        config = {}
+
+    with _setup_lock:
+        _enabled = bool(config.get("trace_enabled", True))
+        _trace_file = config.get("trace_file") or TRACE_FILE
+        _logger = None
+        if not _enabled:
+            return
+        try:
+            _trace_backups = int(config.get("trace_backups", TRACE_BACKUPS))
+            _logger = _build_logger(
+                _trace_file,
+                int(config.get("trace_max_bytes", TRACE_MAX_BYTES)),
+                _trace_backups
+            )
+        except (OSError, ValueError, TypeError) as e:
+            # Tracing must never keep the assistant from starting
+            console.print(f"[yellow]⚠️ Tracing disabled: {e}[/yellow]")
+            _enabled = False
+
+
+def _build_logger(path, max_bytes, backups):
+    """Logger writing one JSON record per line to a rotating file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    logger = logging.getLogger("dea.trace")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    handler = logging.handlers.RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    return logger
+
+
+def _get_logger():
+    global _logger
+    if _logger is None and _enabled:
+        with _setup_lock:
+            if _logger is None:
+                try:
+                    _logger = _build_logger(_trace_file, TRACE_MAX_BYTES, TRACE_BACKUPS)
+                except OSError:
+                    return None
+    return _logger
+
+
+@contextmanager
+def span(stage, **fields):
+    """Time a block and append it to the trace file.
+
+    The outermost span on a thread starts a new interaction; nested spans
+    share its trace id and record their parent stage. Extra fields can be
+    added to the yielded record before the block exits.
+    """
+    if not _enabled:
+        yield dict(fields, stage=stage)
+        return
+
+    trace_id = _current_trace.get()
+    trace_token = None
+    if trace_id is None:
+        trace_id = uuid.uuid4().hex[:12]
+        trace_token = _current_trace.set(trace_id)
+    parent = _current_stage.get()
+    stage_token = _current_stage.set(stage)
+
+    record = dict(fields, stage=stage)
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record["error"] = type(e).__name__
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _current_stage.reset(stage_token)
+        if trace_token is not None:
+            _current_trace.reset(trace_token)
+
+        record.update({
+            "ts": datetime.now().isoformat(),
+            "trace": trace_id,
+            "parent": parent,
+            "ms": round(elapsed_ms, 3)
+        })
+        logger = _get_logger()
+        if logger:
+            logger.info(json.dumps(record, default=str))
+
+
+def traced(stage):
+    """Decorator form of span()"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def load_stats(path=None):
+    """Return per-stage {count, p50, p95, max} in ms from the trace file and its backups"""
+    path = path or _trace_file
+    durations = {}
+    files = [path] + [f"{path}.{i}" for i in range(1, _trace_backups + 1)]
+    for name in files:
+        try:
+            f = open(name, "r", encoding="utf-8")
+        except FileNotFoundError:
+            # Missing, or moved by a rollover while we were reading
+            continue
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    durations.setdefault(record["stage"], []).append(float(record["ms"]))
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    stats = {}
+    for stage, values in durations.items():
+        values.sort()
+        stats[stage] = {
+            "count": len(values),
+            "p50": _percentile(values, 50),
+            "p95": _percentile(values, 95),
+            "max": values[-1]
+        }
+    return stats
@@ -1,8 +1,12 @@
+import contextvars
 import os
+import queue
 import subprocess
+import threading
 import yaml
 from pathlib import Path
 from rich.console import Console
+from src.tracing import span
 
 console = Console()
 
@@ -12,6 +16,12 @@ class TextToSpeech:
         """Initialize TTS with Piper (primary) and espeak (fallback)"""
         self.load_config(config_path)
 
+        # One utterance at a time when driven from several threads
+        self._speak_lock = threading.Lock()
+        # Background speech queue for callers that must not wait on playback
+        self._queue = None
+        self._queue_lock = threading.Lock()
+
         self.piper_available = self.check_piper()
         self.espeak_available = self.check_espeak()
 
@@ -86,6 +96,31 @@ class TextToSpeech:
 
         console.print(f"[cyan]🔊 Speaking: {text[:50]}...[/cyan]")
 
+        with self._speak_lock:
+            with span("tts.speak", engine=force_engine or "auto") as record:
+                record["ok"] = self._speak(text, force_engine)
+                return record["ok"]
+
+    def speak_async(self, text, force_engine=None):
+        """Queue text for a background worker and return immediately"""
+        if not text or not text.strip():
+            return
+        with self._queue_lock:
+            if self._queue is None:
+                self._queue = queue.Queue()
+                threading.Thread(target=self._speak_worker, daemon=True).start()
+        # Carry the caller's trace context so speech spans nest under its command
+        self._queue.put((contextvars.copy_context(), text, force_engine))
+
+    def _speak_worker(self):
+        while True:
+            ctx, text, force_engine = self._queue.get()
+            try:
+                ctx.run(self.speak, text, force_engine=force_engine)
+            except Exception as e:
+                console.print(f"[red]❌ Queued speech failed: {e}[/red]")
+
+    def _speak(self, text, force_engine=None):
         # Forced engine
         if force_engine == "piper":
             if not self.piper_available:
@@ -125,8 +160,10 @@ class TextToSpeech:
         # 1) Try Python module first (BEST, stable)
         try:
             import piper
-            synthesizer = piper.PiperVoice.load(model_path)
-            wav = synthesizer.synthesize(text)
+            with span("tts.piper_load"):
+                synthesizer = piper.PiperVoice.load(model_path)
+            with span("tts.synthesis", engine="piper-python"):
+                wav = synthesizer.synthesize(text)
             return self._play_wav_bytes(wav)
         except Exception as e:
             console.print(f"[yellow]Python Piper failed: {e}[/yellow]")
@@ -139,8 +176,10 @@ class TextToSpeech:
                 wav_file = tf.name
 
             cmd = ["piper", "--model", model_path, "--output_file", wav_file]
-            process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
-            process.communicate(text.encode(), timeout=20)
+            # The CLI loads the model and synthesizes in one process
+            with span("tts.synthesis", engine="piper-cli"):
+                process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+                process.communicate(text.encode(), timeout=20)
 
             if os.path.exists(wav_file):
                 self._play_file(wav_file)
@@ -156,11 +195,12 @@ class TextToSpeech:
     # ------------------------------------------------------
     def speak_espeak(self, text):
         try:
-            result = subprocess.run(
-                ["espeak", "-s", "150", "-a", "100", text],
-                capture_output=True,
-                timeout=30
-            )
+            with span("tts.espeak"):
+                result = subprocess.run(
+                    ["espeak", "-s", "150", "-a", "100", text],
+                    capture_output=True,
+                    timeout=30
+                )
             return result.returncode == 0
         except Exception as e:
             console.print(f"[red]espeak error: {e}[/red]")
@@ -170,7 +210,8 @@ class TextToSpeech:
     # AUDIO PLAYBACK HELPERS
     # ------------------------------------------------------
     def _play_file(self, path):
-        subprocess.run(["aplay", "-q", path], capture_output=True)
+        with span("tts.playback"):
+            subprocess.run(["aplay", "-q", path], capture_output=True)
 
     def _play_wav_bytes(self, wav_bytes):
         """Play WAV bytes from piper Python module."""
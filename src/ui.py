@@ -4,6 +4,7 @@ from rich.panel import Panel
 from rich.table import Table
 from src.weather import get_weather
 from src.system_monitor import get_system_status
+from src.tracing import load_stats
 
 console = Console()
 
@@ -16,17 +17,19 @@ def print_header():
         border_style="magenta"
     ))
 
-def print_weather():
+def print_weather(out=None):
     """Display weather information"""
+    out = out or console
     weather = get_weather()
-    console.print(Panel(
+    out.print(Panel(
         f"[blue]{weather}[/blue]",
         title="Weather",
         border_style="blue"
     ))
 
-def print_system_status():
+def print_system_status(out=None):
     """Display system status"""
+    out = out or console
     status = get_system_status()
     table = Table(title="🔧 System Status", show_header=False)
     table.add_column("Metric", style="cyan", width=15)
@@ -38,11 +41,33 @@ def print_system_status():
     table.add_row("Disk", status['disk'])
     table.add_row("Brightness", status['brightness'])
 
-    console.print(table)
+    out.print(table)
+
+def print_stats(out=None):
+    """Display per-stage latency from the trace file"""
+    out = out or console
+    stats = load_stats()
+    if not stats:
+        out.print("[yellow]📊 No trace data yet.[/yellow]")
+        return
+
+    table = Table(title="📊 Latency by Stage (ms)")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("p50", justify="right", style="green")
+    table.add_column("p95", justify="right", style="yellow")
+    table.add_column("Max", justify="right", style="magenta")
+
+    for stage in sorted(stats):
+        s = stats[stage]
+        table.add_row(stage, str(s["count"]), f"{s['p50']:.1f}", f"{s['p95']:.1f}", f"{s['max']:.1f}")
+
+    out.print(table)
 
-def print_menu():
+def print_menu(out=None):
     """Print available commands"""
-    console.print("\n[bold cyan]Available Commands:[/bold cyan]")
+    out = out or console
+    out.print("\n[bold cyan]Available Commands:[/bold cyan]")
     commands = [
         ("dictation", "Record voice input and add as task"),
         ("show tasks", "List all tasks"),
@@ -56,6 +81,7 @@ def print_menu():
         ("mute/unmute", "Mute/unmute audio"),
         ("weather", "Show current weather"),
         ("status", "Show system status"),
+        ("stats", "Show per-stage latency (p50/p95)"),
         ("notes", "Open notes editor"),
         ("calendar", "Show calendar"),
         ("help", "Show this menu"),
@@ -63,4 +89,4 @@ def print_menu():
     ]
 
     for cmd, desc in commands:
-        console.print(f"  [green]{cmd:20s}[/green] → {desc}")
+        out.print(f"  [green]{cmd:20s}[/green] → {desc}")
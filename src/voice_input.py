@@ -4,8 +4,10 @@ import numpy as np
 import time
 import os
 import wave
+import threading
 from faster_whisper import WhisperModel
 from rich.console import Console
+from src.tracing import span
 
 console = Console()
 
@@ -14,7 +16,8 @@ class VoiceInput:
         self.model_size = model_size
         try:
             console.print(f"[cyan]Loading Whisper model ({model_size})...[/cyan]")
-            self.model = WhisperModel(model_size, device="cpu", compute_type="int8")
+            with span("voice.model_load", model=model_size):
+                self.model = WhisperModel(model_size, device="cpu", compute_type="int8")
             console.print("[green]✅ Model loaded successfully[/green]")
         except Exception as e:
             console.print(f"[red]❌ Failed to load model: {e}[/red]")
@@ -26,6 +29,8 @@ class VoiceInput:
         self.record_duration = 10
         self.sample_rate = 16000
         self.chunk_size = 1024
+        # The microphone and model serve one dictation at a time
+        self._lock = threading.Lock()
 
     def record_audio(self, duration=None):
         """Record audio for specified duration"""
@@ -35,32 +40,35 @@ class VoiceInput:
         console.print(f"[cyan]🎤 Recording for {duration} seconds...[/cyan]")
 
         try:
-            p = pyaudio.PyAudio()
-            stream = p.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size
-            )
-
-            frames = []
-            for _ in range(0, int(self.sample_rate / self.chunk_size * duration)):
-                data = stream.read(self.chunk_size)
-                frames.append(data)
-
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
+            with span("voice.device_open"):
+                p = pyaudio.PyAudio()
+                stream = p.open(
+                    format=pyaudio.paInt16,
+                    channels=1,
+                    rate=self.sample_rate,
+                    input=True,
+                    frames_per_buffer=self.chunk_size
+                )
+
+            with span("voice.capture", seconds=duration):
+                frames = []
+                for _ in range(0, int(self.sample_rate / self.chunk_size * duration)):
+                    data = stream.read(self.chunk_size)
+                    frames.append(data)
+
+                stream.stop_stream()
+                stream.close()
+                p.terminate()
 
             # Save to temporary WAV file
-            temp_file = "/tmp/dea_recording.wav"
-            wf = wave.open(temp_file, 'wb')
-            wf.setnchannels(1)
-            wf.setsampwidth(p.get_sample_size(pyaudio.paInt16))
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(b''.join(frames))
-            wf.close()
+            with span("voice.wav_write"):
+                temp_file = "/tmp/dea_recording.wav"
+                wf = wave.open(temp_file, 'wb')
+                wf.setnchannels(1)
+                wf.setsampwidth(p.get_sample_size(pyaudio.paInt16))
+                wf.setframerate(self.sample_rate)
+                wf.writeframes(b''.join(frames))
+                wf.close()
 
             console.print("[green]✅ Recording complete[/green]")
             return temp_file
@@ -77,9 +85,11 @@ class VoiceInput:
 
         try:
             console.print("[cyan]🔄 Transcribing...[/cyan]")
-            segments, info = self.model.transcribe(audio_file, beam_size=5)
+            with span("voice.decode", model=self.model_size):
+                # Segments are decoded lazily, so join inside the span
+                segments, info = self.model.transcribe(audio_file, beam_size=5)
+                text = " ".join([segment.text for segment in segments])
 
-            text = " ".join([segment.text for segment in segments])
             console.print(f"[green]✅ Transcription: {text}[/green]")
             return text.strip()
 
@@ -89,13 +99,14 @@ class VoiceInput:
 
     def get_voice_input(self):
         """Record and transcribe voice input"""
-        audio_file = self.record_audio()
-        if audio_file:
-            text = self.transcribe_audio(audio_file)
-            # Clean up temp file
-            try:
-                os.remove(audio_file)
-            except:
-                pass
-            return text
-        return ""
+        with self._lock:
+            audio_file = self.record_audio()
+            if audio_file:
+                text = self.transcribe_audio(audio_file)
+                # Clean up temp file
+                try:
+                    os.remove(audio_file)
+                except:
+                    pass
+                return text
+            return ""
@@ -2,6 +2,7 @@
 import requests
 from requests.adapters import HTTPAdapter, Retry
 from rich.console import Console
+from src.tracing import traced
 
 console = Console()
 
@@ -15,6 +16,7 @@ retries = Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
 session.mount("https://", HTTPAdapter(max_retries=retries))
 
 
+@traced("weather.fetch")
 def get_weather(lat=DEFAULT_LAT, lon=DEFAULT_LON):
     """Get weather from Open-Meteo API."""
     params = {